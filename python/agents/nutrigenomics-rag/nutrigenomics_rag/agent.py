@@ -37,8 +37,8 @@ nutrigenomics_retrieval = VertexAiRagRetrieval(
             rag_corpus=os.environ.get("RAG_CORPUS"),
         )
     ],
-    similarity_top_k=12,
-    vector_distance_threshold=0.55,
+    similarity_top_k=6,
+    vector_distance_threshold=0.45,
 )
 
 root_agent = Agent(
@@ -47,6 +47,12 @@ PDF_URL = "https://www.ncbi.nlm.nih.gov/pmc/articles/PMC3257702/pdf/nihms353847.
 PDF_FILENAME = "nutrigenomics_primer.pdf"
 ENV_FILE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
 
+# Chunking applied when files are uploaded to the corpus. A modest overlap is
+# enough to preserve cross-boundary context; larger overlaps embed the same
+# text twice and inflate both indexing cost and index size.
+CHUNK_SIZE = 1024
+CHUNK_OVERLAP = 100
+
 
 # --- Start of the script ---
 def initialize_vertex_ai() -> None:
@@ -85,7 +91,9 @@ def download_pdf_from_url(url: str, output_path: str) -> str:
     response.raise_for_status()
 
     with open(output_path, "wb") as file_handle:
-        for chunk in response.iter_content(chunk_size=8192):
+        # 1 MiB chunks keep the per-chunk Python overhead negligible for
+        # multi-megabyte PDFs compared to the default small reads.
+        for chunk in response.iter_content(chunk_size=1 << 20):
             file_handle.write(chunk)
 
     print(f"PDF downloaded successfully to {output_path}")
@@ -99,11 +107,18 @@ def upload_pdf_to_corpus(
 
     print(f"Uploading {display_name} to corpus...")
     try:
+        transformation_config = rag.TransformationConfig(
+            chunking_config=rag.ChunkingConfig(
+                chunk_size=CHUNK_SIZE,
+                chunk_overlap=CHUNK_OVERLAP,
+            )
+        )
         rag_file = rag.upload_file(
             corpus_name=corpus_name,
             path=pdf_path,
             display_name=display_name,
             description=description,
+            transformation_config=transformation_config,
         )
         print(f"Successfully uploaded {display_name} to corpus")
         return rag_file